@@ -2,14 +2,15 @@
 
 import sys
 
-from rich.console import Console
 from rich.live import Live
+from rich.text import Text
 
-from mini_chat.api import APIError, send_message
+from mini_chat.api import APIError, close_session, send_message
 from mini_chat.cli import process_command
 from mini_chat.config import load_config
 from mini_chat.models import Conversation
 from mini_chat.ui import (
+    console,
     create_loading_display,
     display_conversation,
     get_user_input,
@@ -17,8 +18,6 @@ from mini_chat.ui import (
 )
 from mini_chat.utils import setup_signal_handler
 
-console = Console()
-
 
 def main() -> None:
     """Run the terminal chatbot."""
@@ -33,37 +32,65 @@ def main() -> None:
     system_prompt = config.get("system_prompt", "You are a helpful assistant.")
     conversation.add_message("system", system_prompt)
 
-    # Main interaction loop
-    continue_running = True
-    while continue_running:
-        # Display conversation
-        display_conversation(conversation)
-
-        # Get user input
-        user_input = get_user_input()
-
-        # Handle commands
-        if user_input.startswith("/"):
-            continue_running, config = process_command(user_input, conversation, config)
-            continue
-
-        # Add user message
-        conversation.add_message("user", user_input)
-
-        # Add empty assistant message (will be filled in with the response)
-        conversation.add_message("assistant", "")
-
-        # Create a Live display for the assistant's response with loading spinner
-        with Live(console=console, refresh_per_second=10) as live, create_loading_display() as _:
-            try:
-                # Send message with streaming updates
-                content_callback = handle_streaming_response(conversation, live)
-                send_message(conversation, content_callback)
-            except APIError as e:
-                # Show error and revert assistant message on failure
-                conversation.messages.pop()  # Remove assistant message
-                console.print(f"[bold red]API Error: {e}[/bold red]")
-                input("Press Enter to continue...")
+    # Main interaction loop, closing the API connections however it ends
+    try:
+        continue_running = True
+        while continue_running:
+            # Display conversation
+            display_conversation(conversation)
+
+            # Get user input
+            user_input = get_user_input()
+
+            # Handle commands
+            if user_input.startswith("/"):
+                continue_running, config = process_command(user_input, conversation, config)
+                # Redraw the conversation over whatever the command printed
+                conversation.rendered_count = 0
+                continue
+
+            # Add user message
+            conversation.add_message("user", user_input)
+
+            # Show the loading spinner in a new Live display until the response streams
+            # in; a Live cannot be restarted cleanly, as stop() leaves its overflow mode
+            # and last frame behind. Streamed text is drawn at this rate however quickly
+            # it arrives, and once more when the display stops
+            with (
+                create_loading_display() as progress,
+                Live(
+                    progress,
+                    console=console,
+                    refresh_per_second=15,
+                    vertical_overflow="ellipsis",
+                ) as live,
+            ):
+                try:
+                    # Send message with streaming updates
+                    content_callback = handle_streaming_response(conversation, live)
+                    send_message(conversation, content_callback)
+                except APIError as e:
+                    # Show error and drop a partially streamed response
+                    if conversation.messages[-1].role == "assistant":
+                        conversation.messages.pop()
+                    console.print(f"[bold red]API Error: {e}[/bold red]")
+                    input("Press Enter to continue...")
+                    conversation.rendered_count = 0
+                else:
+                    if conversation.messages[-1].role != "assistant":
+                        # The stream carried no text, so the spinner is still showing;
+                        # clear it, record an empty reply to keep the turns alternating
+                        # and redraw the conversation
+                        live.update(Text(""))
+                        conversation.add_message("assistant", "")
+                        conversation.rendered_count = 0
+                    else:
+                        # The input was echoed and the response streamed, so both are
+                        # on screen
+                        conversation.rendered_count = len(conversation.messages)
+    finally:
+        # Release the pooled API connections on the way out
+        close_session()
 
 
 if __name__ == "__main__":
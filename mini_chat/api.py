@@ -1,15 +1,29 @@
 """API communication layer for the terminal chatbot."""
 
-import json
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from types import MappingProxyType
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter, Retry
 from requests.exceptions import RequestException
 
 from mini_chat.config import get_api_key, load_config
 from mini_chat.models import Conversation
 
+# Use orjson for encoding requests and decoding responses when it is installed
+try:
+    from orjson import dumps as _json_dumps
+    from orjson import loads as _json_loads
+except ImportError:
+    import json
+
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        """Serialize an object to compact UTF-8 encoded JSON."""
+        return json.dumps(obj, separators=(",", ":")).encode()
+
 
 class APIError(Exception):
     """Exception raised for API errors."""
@@ -17,6 +31,106 @@ class APIError(Exception):
     pass
 
 
+# Prefix of stream lines that carry a chunk, and the payload marking the end
+_DATA_PREFIX = b"data: "
+_DONE = b"[DONE]"
+
+# Key preceding the delta text in a stream chunk, e.g. {"delta":{"content":"Hi"}}
+_CONTENT_FIELD = b'"content"'
+_CONTENT_KEY = b'"content":"'
+
+# Read size for streamed responses; chunks are yielded as they arrive, so a
+# larger size only avoids splitting big network chunks into many small reads
+_STREAM_CHUNK_SIZE = 8192
+
+# (connect, read) timeouts in seconds; a streamed read only waits for the next chunk
+_REQUEST_TIMEOUT = (5, 30)
+_STREAM_TIMEOUT = (5, 60)
+
+
+def _create_session() -> requests.Session:
+    """Create the session used for API requests.
+
+    Connections are kept alive and pooled per host. A request that fails to connect
+    never reached the server, so it is retried twice with a short backoff. Anything
+    later is not retried: a completion is not idempotent, and once the request is
+    sent, even a gateway error may come after the model has generated a reply.
+    """
+    retry = Retry(
+        total=2,
+        connect=2,
+        read=False,
+        status=0,
+        backoff_factor=0.2,
+        # Never wait out a server-chosen delay with the UI blocked
+        respect_retry_after_header=False,
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Shared session so keep-alive connections are reused across requests
+_SESSION = _create_session()
+
+
+def close_session() -> None:
+    """Close the pooled connections of the shared session."""
+    _SESSION.close()
+
+
+# Configuration used for requests, loaded lazily and reused across turns
+_CONFIG_CACHE: dict[str, Any] | None = None
+
+# Request headers and the API key they were built for
+_HEADERS_CACHE: tuple[str, Mapping[str, str]] | None = None
+
+# Request body reused across turns; only the messages and stream flag change
+_REQUEST_TEMPLATE: dict[str, Any] | None = None
+
+
+def get_cached_config() -> dict[str, Any]:
+    """Get the active configuration, loading it on first use."""
+    global _CONFIG_CACHE
+    if _CONFIG_CACHE is None:
+        _CONFIG_CACHE = load_config()
+    return _CONFIG_CACHE
+
+
+def get_cached_headers(api_key: str) -> Mapping[str, str]:
+    """Get the read-only request headers for an API key, building them once."""
+    global _HEADERS_CACHE
+    if _HEADERS_CACHE is None or _HEADERS_CACHE[0] != api_key:
+        headers = {"Content-Type": "application/json", "Authorization": f"Bearer {api_key}"}
+        _HEADERS_CACHE = (api_key, MappingProxyType(headers))
+    return _HEADERS_CACHE[1]
+
+
+def get_request_template() -> dict[str, Any]:
+    """Get the request body for the cached configuration, building it on first use."""
+    global _REQUEST_TEMPLATE
+    if _REQUEST_TEMPLATE is None:
+        config = get_cached_config()
+        _REQUEST_TEMPLATE = {
+            "model": config["model"],
+            "messages": [],
+            "max_tokens": config["max_tokens"],
+            "temperature": config["temperature"],
+            "stream": False,
+        }
+    return _REQUEST_TEMPLATE
+
+
+def invalidate_config_cache() -> None:
+    """Drop the cached configuration, headers and request body so they are rebuilt."""
+    global _CONFIG_CACHE, _HEADERS_CACHE, _REQUEST_TEMPLATE
+    _CONFIG_CACHE = None
+    _HEADERS_CACHE = None
+    _REQUEST_TEMPLATE = None
+
+
 def send_message(
     conversation: Conversation, on_content: Callable[[str], None] | None = None
 ) -> str:
@@ -32,21 +146,18 @@ def send_message(
     Raises:
         APIError: If API request fails
     """
-    config = load_config()
     api_key = get_api_key()
 
     if not api_key:
         raise APIError("API key not found. Please set the API_KEY environment variable.")
 
-    headers = {"Content-Type": "application/json", "Authorization": f"Bearer {api_key}"}
+    config = get_cached_config()
 
-    data = {
-        "model": config["model"],
-        "messages": conversation.to_api_format(),
-        "max_tokens": config["max_tokens"],
-        "temperature": config["temperature"],
-        "stream": bool(on_content),  # Stream if callback is provided
-    }
+    headers = get_cached_headers(api_key)
+
+    data = get_request_template()
+    data["messages"] = conversation.to_api_format()
+    data["stream"] = bool(on_content)  # Stream if callback is provided
 
     try:
         if on_content:
@@ -57,61 +168,114 @@ def send_message(
         raise APIError(f"API request failed: {e!s}") from e
 
 
-def _send_request(headers: dict[str, str], data: dict[str, Any], base_url: str) -> str:
+def _send_request(headers: Mapping[str, str], data: dict[str, Any], base_url: str) -> str:
     """Send a non-streaming request to the API."""
     url = f"{base_url}/chat/completions"
     try:
-        response = requests.post(url, headers=headers, json=data, timeout=30)
+        response = _SESSION.post(
+            url, headers=headers, data=_json_dumps(data), timeout=_REQUEST_TIMEOUT
+        )
 
         if response.status_code != 200:
             raise APIError(f"API returned error {response.status_code}: {response.text}")
 
-        result = response.json()
+        # The API responds with UTF-8 JSON, so skip requests' charset detection
+        result = _json_loads(response.content)
         return result["choices"][0]["message"]["content"]
     except RequestException as e:
         raise APIError(f"API request failed: {e!s}") from e
+    except ValueError as e:
+        raise APIError(f"API returned invalid JSON: {e!s}") from e
+
+
+def _extract_content(payload: bytes) -> str | None:
+    """Extract the delta content from a stream chunk without parsing the whole JSON object.
+
+    Returns None when the fast path does not apply (no plain string content, or the
+    string contains escapes), in which case the chunk must be parsed as JSON.
+    """
+    start = payload.find(_CONTENT_KEY)
+    if start < 0:
+        return None
+    start += len(_CONTENT_KEY)
+    end = payload.find(b'"', start)
+    if end < 0 or payload.find(b"\\", start, end) >= 0:
+        return None
+    return payload[start:end].decode()
+
+
+def _iter_lines(response: requests.Response) -> Iterator[bytes]:
+    """Split a streamed response body into lines.
+
+    Each network chunk is split once with bytes.split; only the trailing partial
+    line is carried over to the next chunk.
+    """
+    pending = b""
+    for block in response.iter_content(chunk_size=_STREAM_CHUNK_SIZE):
+        block = pending + block
+        if b"\r" in block:
+            block = block.replace(b"\r\n", b"\n")
+        lines = block.split(b"\n")
+        pending = lines.pop()
+        yield from lines
+
+    if pending:
+        yield pending
+
+
+def _iter_content_deltas(lines: Iterable[bytes]) -> Iterator[str]:
+    """Yield the non-empty delta texts from the lines of a stream, up to [DONE]."""
+    for line in lines:
+        # Only "data: " lines carry chunks; this also skips blank and ": ping" lines
+        if not line.startswith(_DATA_PREFIX):
+            continue
+
+        payload = line[6:]
+        if payload == _DONE:
+            return
+
+        # Role-only and finish chunks carry no text and need not be parsed
+        if _CONTENT_FIELD not in payload:
+            continue
+
+        try:
+            content = _extract_content(payload)
+            if content is None:
+                chunk = _json_loads(payload)
+                if chunk.get("choices"):
+                    content = chunk["choices"][0].get("delta", {}).get("content")
+        except ValueError:
+            # Both json and orjson decode errors subclass ValueError
+            continue
+
+        if content:
+            yield content
 
 
 def _stream_response(
-    headers: dict[str, str], data: dict[str, Any], base_url: str, on_content: Callable[[str], None]
+    headers: Mapping[str, str],
+    data: dict[str, Any],
+    base_url: str,
+    on_content: Callable[[str], None],
 ) -> str:
-    """Send a streaming request to the API and process chunks."""
+    """Send a streaming request to the API and process chunks.
+
+    Each delta is passed to on_content as soon as it is parsed; the display decides
+    how often to redraw.
+    """
     url = f"{base_url}/chat/completions"
-    response = requests.post(url, headers=headers, json=data, stream=True, timeout=60)
 
-    if response.status_code != 200:
-        raise APIError(f"API returned error {response.status_code}: {response.text}")
+    # Leaving the block closes the response, including on errors and Ctrl+C
+    with _SESSION.post(
+        url, headers=headers, data=_json_dumps(data), stream=True, timeout=_STREAM_TIMEOUT
+    ) as response:
+        if response.status_code != 200:
+            raise APIError(f"API returned error {response.status_code}: {response.text}")
 
-    # Collect the full response while also calling the callback
-    full_response = ""
+        # Collect the response pieces while showing each one
+        parts: list[str] = []
+        for content in _iter_content_deltas(_iter_lines(response)):
+            parts.append(content)
+            on_content(content)
 
-    try:
-        for line in response.iter_lines():
-            if not line:
-                continue
-
-            # Remove the "data: " prefix
-            if line.startswith(b"data: "):
-                line = line[6:]
-
-            # "[DONE]" marks the end of the stream
-            if line == b"[DONE]":
-                break
-
-            try:
-                chunk = json.loads(line)
-                if chunk.get("choices") and chunk["choices"]:
-                    delta = chunk["choices"][0].get("delta", {})
-                    if "content" in delta:
-                        content = delta["content"]
-                        full_response += content
-                        on_content(content)
-            except json.JSONDecodeError:
-                pass
-    except KeyboardInterrupt:
-        # Close the response connection properly
-        response.close()
-        # Re-raise to be caught by the main try/except
-        raise
-
-    return full_response
+    return "".join(parts)
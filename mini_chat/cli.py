@@ -1,12 +1,14 @@
 """Command-line interface for the terminal chatbot."""
 
+from collections.abc import Callable, Iterable
 from typing import Any
 
-from rich.console import Console
-from rich.table import Table
+from rich.console import Group
 
+from mini_chat.api import invalidate_config_cache
 from mini_chat.config import (
     DEFAULT_CONFIG,
+    default_config,
     get_active_profile,
     list_available_profiles,
     load_config,
@@ -14,25 +16,64 @@ from mini_chat.config import (
     set_active_profile,
     update_config,
 )
-from mini_chat.models import Conversation, Message
-from mini_chat.ui import show_help
+from mini_chat.models import Conversation
+from mini_chat.ui import console, show_help
 from mini_chat.utils import pause_after
 
-console = Console()
+# Commands that may change the saved configuration
+_CONFIG_COMMANDS = frozenset({"/system", "/config", "/save", "/reset", "/profile"})
+
+# Strings accepted as true for boolean settings
+_TRUE_VALUES = frozenset({"true", "yes", "1", "y"})
+
+
+def _to_bool(value: str) -> bool:
+    """Convert a /config value to a boolean."""
+    return value.lower() in _TRUE_VALUES
+
+
+def _coercer_for(default_value: Any) -> Callable[[str], Any]:
+    """Get the function converting a /config value to the type of a default."""
+    # bool is a subclass of int, so it must be checked first
+    if isinstance(default_value, bool):
+        return _to_bool
+    if isinstance(default_value, int):
+        return int
+    if isinstance(default_value, float):
+        return float
+    return str
+
+
+# Settings shown by /config, in display order; the API key is never shown
+_HIDDEN_KEYS = frozenset({"api_key"})
+_SORTED_DISPLAY_KEYS = tuple(sorted(DEFAULT_CONFIG.keys() - _HIDDEN_KEYS))
+_KNOWN_KEYS = frozenset(_SORTED_DISPLAY_KEYS) | _HIDDEN_KEYS
+
+# Value converters for the known settings, built once from the defaults
+_COERCERS: dict[str, Callable[[str], Any]] = {
+    key: _coercer_for(value) for key, value in DEFAULT_CONFIG.items()
+}
 
 
 @pause_after
 def show_config(config: dict[str, Any]) -> None:
     """Display the current configuration."""
+    # Tables are only needed by /config and /help, so rich.table is imported on demand
+    from rich.table import Table
+
     active_profile = get_active_profile()
 
     table = Table(title=f"Configuration: [bold]{active_profile}[/bold] profile")
     table.add_column("Setting", style="bold blue")
     table.add_column("Value", style="green")
 
-    # Sort keys for consistent display
-    for key in sorted(config.keys()):
-        if key != "api_key":  # Don't show API key
+    # Sort keys for consistent display; only settings without a default need sorting
+    keys: Iterable[str] = _SORTED_DISPLAY_KEYS
+    if not config.keys() <= _KNOWN_KEYS:
+        keys = sorted(config.keys() - _HIDDEN_KEYS)
+
+    for key in keys:
+        if key in config:
             value = str(config[key])
             # Truncate long values (e.g., system prompt)
             if len(value) > 50:
@@ -45,10 +86,13 @@ def show_config(config: dict[str, Any]) -> None:
 @pause_after
 def show_system_message(conversation: Conversation) -> None:
     """Display the current system message."""
-    system_msgs = [msg for msg in conversation.messages if msg.role == "system"]
-    if system_msgs:
-        console.print("[bold]Current system message:[/bold]")
-        console.print(system_msgs[0].content)
+    if conversation.system_index is not None:
+        console.print(
+            Group(
+                "[bold]Current system message:[/bold]",
+                conversation.messages[conversation.system_index].content,
+            )
+        )
     else:
         console.print("[bold yellow]No system message set.[/bold yellow]")
 
@@ -85,14 +129,7 @@ def handle_config_command(
             value = value.strip()
 
             # Convert value to appropriate type based on default
-            if key in DEFAULT_CONFIG:
-                default_value = DEFAULT_CONFIG[key]
-                if isinstance(default_value, bool):
-                    value = value.lower() in ("true", "yes", "1", "y")
-                elif isinstance(default_value, int):
-                    value = int(value)
-                elif isinstance(default_value, float):
-                    value = float(value)
+            value = _COERCERS.get(key, str)(value)
 
             # Update the config and get the updated version
             updated_config = update_config(key, value)
@@ -101,12 +138,7 @@ def handle_config_command(
             # Special handling for system_prompt
             if key == "system_prompt":
                 # Update the system message in the conversation
-                for i, msg in enumerate(conversation.messages):
-                    if msg.role == "system":
-                        conversation.messages[i] = Message(role="system", content=value)
-                        break
-                else:
-                    conversation.add_message("system", value)
+                conversation.set_system(value)
 
             return updated_config
         except ValueError:
@@ -120,7 +152,7 @@ def handle_reset_command(args: str, config: dict[str, Any]) -> dict[str, Any]:
     """Handle the /reset command."""
     if args == "config":
         # Reset to default config
-        updated_config = DEFAULT_CONFIG.copy()
+        updated_config = default_config()
         updated_config["api_key"] = config["api_key"]  # Keep API key
         save_config(updated_config)
         with pause_after():
@@ -139,10 +171,12 @@ def handle_profile_command(
     if not args:
         # Show current profile using context manager
         with pause_after():
-            console.print(f"[bold]Current profile:[/bold] {get_active_profile()}")
             console.print(
-                "[italic]Profiles can be managed manually by editing files in "
-                "~/.config/mini-chat/profiles/[/italic]"
+                Group(
+                    f"[bold]Current profile:[/bold] {get_active_profile()}",
+                    "[italic]Profiles can be managed manually by editing files in "
+                    "~/.config/mini-chat/profiles/[/italic]",
+                )
             )
         return config
     else:
@@ -157,8 +191,12 @@ def handle_profile_command(
 
             if profile_name not in profiles:
                 with pause_after():
-                    console.print(f"[bold red]Profile '{profile_name}' does not exist.[/bold red]")
-                    console.print(f"[italic]Available profiles: {', '.join(profiles)}[/italic]")
+                    console.print(
+                        Group(
+                            f"[bold red]Profile '{profile_name}' does not exist.[/bold red]",
+                            f"[italic]Available profiles: {', '.join(profiles)}[/italic]",
+                        )
+                    )
                 return config
 
             # Set as active profile
@@ -166,8 +204,7 @@ def handle_profile_command(
             updated_config = load_config()
 
             # Start a new session with the new system prompt
-            conversation.messages.clear()
-            conversation.add_message("system", updated_config["system_prompt"])
+            conversation.reset(updated_config["system_prompt"])
 
             console.print(f"[bold green]Switched to profile: {profile_name}[/bold green]")
             return updated_config
@@ -178,6 +215,51 @@ def handle_profile_command(
             return config
 
 
+def _handle_help_command(
+    args: str, conversation: Conversation, config: dict[str, Any]
+) -> dict[str, Any]:
+    """Handle the /help command."""
+    show_help()
+    return config
+
+
+def _handle_clear_command(
+    args: str, conversation: Conversation, config: dict[str, Any]
+) -> dict[str, Any]:
+    """Handle the /clear command."""
+    conversation.clear()
+    console.print("[bold yellow]Conversation cleared.[/bold yellow]")
+    return config
+
+
+def _handle_save_command(
+    args: str, conversation: Conversation, config: dict[str, Any]
+) -> dict[str, Any]:
+    """Handle the /save command."""
+    save_config(config)
+    console.print("[bold green]Configuration saved.[/bold green]")
+    return config
+
+
+def _handle_reset_command(
+    args: str, conversation: Conversation, config: dict[str, Any]
+) -> dict[str, Any]:
+    """Handle the /reset command."""
+    return handle_reset_command(args, config)
+
+
+# Handlers for every command except /exit, which stops the main loop instead
+_COMMAND_HANDLERS: dict[str, Callable[[str, Conversation, dict[str, Any]], dict[str, Any]]] = {
+    "/help": _handle_help_command,
+    "/clear": _handle_clear_command,
+    "/system": handle_system_command,
+    "/config": handle_config_command,
+    "/save": _handle_save_command,
+    "/reset": _handle_reset_command,
+    "/profile": handle_profile_command,
+}
+
+
 def process_command(
     command: str, conversation: Conversation, config: dict[str, Any]
 ) -> tuple[bool, dict[str, Any]]:
@@ -189,35 +271,30 @@ def process_command(
         - continue_running: True if the app should continue running, False to exit
         - updated_config: The updated configuration (may be the same as input if no changes)
     """
-    # Split command and arguments
-    parts = command.split(" ", 1)
+    # Split command and arguments on the first run of whitespace
+    parts = command.split(maxsplit=1)
     cmd = parts[0]
     args = parts[1] if len(parts) > 1 else ""
 
-    # Start with the current config
-    updated_config = config.copy()
-
     if cmd == "/exit":
         console.print("[bold yellow]mini-chat exiting...[/bold yellow]")
-        return False, updated_config
-    elif cmd == "/help":
-        show_help()
-    elif cmd == "/clear":
-        conversation.clear()
-        console.print("[bold yellow]Conversation cleared.[/bold yellow]")
-    elif cmd == "/system":
-        updated_config = handle_system_command(args, conversation, config)
-    elif cmd == "/config":
-        updated_config = handle_config_command(args, conversation, config)
-    elif cmd == "/save":
-        save_config(updated_config)
-        console.print("[bold green]Configuration saved.[/bold green]")
-    elif cmd == "/reset":
-        updated_config = handle_reset_command(args, config)
-    elif cmd == "/profile":
-        updated_config = handle_profile_command(args, conversation, config)
-    else:
-        console.print(f"[bold red]Unknown command: {cmd}[/bold red]")
-        console.print("Type /help for a list of commands.")
+        return False, config
+
+    handler = _COMMAND_HANDLERS.get(cmd)
+    if handler is None:
+        console.print(
+            Group(
+                f"[bold red]Unknown command: {cmd}[/bold red]",
+                "Type /help for a list of commands.",
+            )
+        )
+        return True, config
+
+    # Handlers return a new dict only when they change the config
+    updated_config = handler(args, conversation, config)
+
+    # Make the next API request pick up any saved changes
+    if cmd in _CONFIG_COMMANDS:
+        invalidate_config_cache()
 
     return True, updated_config
@@ -1,30 +1,60 @@
 """Configuration management for the terminal chatbot."""
 
+import copy
 import logging
 import os
 import pathlib
+import stat
+import tempfile
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
 from typing import Any
 
 import yaml  # type: ignore
 
+# Prefer the libyaml-based loader and dumper, which are much faster than the
+# pure-Python ones
+try:
+    from yaml import CSafeDumper as SafeDumper  # type: ignore
+    from yaml import CSafeLoader as SafeLoader  # type: ignore
+except ImportError:
+    from yaml import SafeDumper, SafeLoader  # type: ignore
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("mini_chat.config")
 
-# Default configuration
-DEFAULT_CONFIG: dict[str, Any] = {
-    # API settings
-    "api_base_url": "https://api.openai.com/v1",
-    "model": "gpt-4o-mini",
-    "max_tokens": 1000,
-    "temperature": 0.7,
-    "stream": True,
-    "system_prompt": (
-        "You are a helpful assistant. "
-        "You use math formulas that could be displayed in pure texts "
-        "but not in LaTeX unless the user asks for it. "
-    ),
-}
+# Default configuration, read-only; use default_config() for a dict to modify
+DEFAULT_CONFIG: Mapping[str, Any] = MappingProxyType(
+    {
+        # API settings
+        "api_base_url": "https://api.openai.com/v1",
+        "model": "gpt-4o-mini",
+        "max_tokens": 1000,
+        "temperature": 0.7,
+        "stream": True,
+        "system_prompt": (
+            "You are a helpful assistant. "
+            "You use math formulas that could be displayed in pure texts "
+            "but not in LaTeX unless the user asks for it. "
+        ),
+    }
+)
+
+
+def default_config() -> dict[str, Any]:
+    """Get a new dict holding the default configuration."""
+    return dict(DEFAULT_CONFIG)
+
+
+# Environment variables overriding config values: (variable, config key, converter)
+_ENV_OVERRIDES: tuple[tuple[str, str, Callable[[str], Any]], ...] = (
+    ("API_BASE_URL", "api_base_url", str),
+    ("API_MODEL", "model", str),
+    ("API_MAX_TOKENS", "max_tokens", int),
+    ("API_TEMPERATURE", "temperature", float),
+    ("SYSTEM_PROMPT", "system_prompt", str),
+)
 
 # Config file location
 USER_CONFIG_DIR = pathlib.Path.home() / ".config" / "mini-chat"
@@ -44,10 +74,58 @@ def get_profile_path(profile_name: str) -> pathlib.Path:
     return CONFIG_PROFILES_DIR / f"{profile_name}.yaml"
 
 
+# Profile lookups are cached since commands query them repeatedly; entries are
+# keyed by path and dropped whenever a profile changes. They are also checked
+# against the mtime of the file or directory so edits made outside mini-chat show up.
+_ACTIVE_PROFILE_CACHE: tuple[pathlib.Path, int, str] | None = None
+_PROFILE_LIST_CACHE: tuple[pathlib.Path, int, list[str]] | None = None
+
+# Parsed profile files, keyed by path and valid while the file's mtime and size match
+_PROFILE_CACHE: dict[pathlib.Path, tuple[int, int, dict[str, Any]]] = {}
+
+
+def invalidate_profile_caches() -> None:
+    """Drop cached profile lookups so the next call reads from disk."""
+    global _ACTIVE_PROFILE_CACHE, _PROFILE_LIST_CACHE
+    _ACTIVE_PROFILE_CACHE = None
+    _PROFILE_LIST_CACHE = None
+    _PROFILE_CACHE.clear()
+
+
+def _cache_profile(config_path: pathlib.Path, profile_config: dict[str, Any]) -> None:
+    """Remember the parsed contents of a profile file as of its current stat."""
+    st = config_path.stat()
+    _PROFILE_CACHE[config_path] = (st.st_mtime_ns, st.st_size, profile_config)
+
+
 def get_active_profile() -> str:
     """Get the name of the active profile."""
+    try:
+        mtime = ACTIVE_PROFILE_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        mtime = None
+
+    if mtime is not None and _ACTIVE_PROFILE_CACHE is not None:
+        path, cached_mtime, profile = _ACTIVE_PROFILE_CACHE
+        if path == ACTIVE_PROFILE_FILE and mtime == cached_mtime:
+            return profile
+
+    profile = _read_active_profile()
+    _cache_active_profile(profile)
+    return profile
+
+
+def _cache_active_profile(profile: str) -> None:
+    """Remember the active profile as of the file's current mtime."""
+    global _ACTIVE_PROFILE_CACHE
+    _ACTIVE_PROFILE_CACHE = (ACTIVE_PROFILE_FILE, ACTIVE_PROFILE_FILE.stat().st_mtime_ns, profile)
+
+
+def _read_active_profile() -> str:
+    """Read the active profile name from disk."""
     if not ACTIVE_PROFILE_FILE.exists():
         # Create with default profile if it doesn't exist
+        ensure_config_dirs()
         with ACTIVE_PROFILE_FILE.open("w") as f:
             f.write(DEFAULT_PROFILE_NAME)
         return DEFAULT_PROFILE_NAME
@@ -59,14 +137,50 @@ def get_active_profile() -> str:
 
 def set_active_profile(profile_name: str) -> None:
     """Set the active profile."""
-    ensure_config_dirs()
-    with ACTIVE_PROFILE_FILE.open("w") as f:
-        f.write(profile_name)
+    if get_active_profile() == profile_name:
+        return
+
+    _write_text_atomic(ACTIVE_PROFILE_FILE, profile_name)
+    _cache_active_profile(profile_name)
+
+
+def _file_mode(path: pathlib.Path) -> int:
+    """Get the permission bits of a file, or those a new file would get from the umask."""
+    try:
+        return stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def _write_text_atomic(path: pathlib.Path, text: str) -> None:
+    """Write a file by replacing it, so readers never see it partially written."""
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    tmp_path = pathlib.Path(tmp_name)
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+        # mkstemp creates the file owner-only; keep the mode the file had, or would
+        # have had if written directly
+        tmp_path.chmod(_file_mode(path))
+        tmp_path.replace(path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
 def list_available_profiles() -> list[str]:
     """List all available configuration profiles."""
+    global _PROFILE_LIST_CACHE
     ensure_config_dirs()
+    # Adding or removing a profile file changes the directory's mtime
+    mtime = CONFIG_PROFILES_DIR.stat().st_mtime_ns
+    if _PROFILE_LIST_CACHE is not None:
+        path, cached_mtime, profiles = _PROFILE_LIST_CACHE
+        if path == CONFIG_PROFILES_DIR and mtime == cached_mtime:
+            return list(profiles)
+
     profiles = []
     for file in CONFIG_PROFILES_DIR.glob("*.yaml"):
         profiles.append(file.stem)
@@ -75,7 +189,9 @@ def list_available_profiles() -> list[str]:
     if DEFAULT_PROFILE_NAME not in profiles:
         profiles.append(DEFAULT_PROFILE_NAME)
 
-    return sorted(profiles)
+    profiles.sort()
+    _PROFILE_LIST_CACHE = (CONFIG_PROFILES_DIR, mtime, profiles)
+    return list(profiles)
 
 
 def save_config(config: dict[str, Any], profile_name: str | None = None) -> None:
@@ -94,9 +210,13 @@ def save_config(config: dict[str, Any], profile_name: str | None = None) -> None
     # Get the path for this profile
     config_path = get_profile_path(profile_name)
 
-    logger.debug(f"Saving config to {config_path}: {save_config}")
+    logger.debug("Saving config to %s: %s", config_path, save_config)
     with config_path.open("w") as f:
-        yaml.dump(save_config, f, default_flow_style=False, sort_keys=False)
+        yaml.dump(save_config, f, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
+    invalidate_profile_caches()
+
+    # The saved dict is what the file now holds, so the next load needs no parse
+    _cache_profile(config_path, copy.deepcopy(save_config))
 
 
 def clone_profile(source_profile: str, target_profile: str) -> dict[str, Any]:
@@ -111,19 +231,26 @@ def load_profile_config(profile_name: str) -> dict[str, Any]:
     config_path = get_profile_path(profile_name)
 
     if not config_path.exists():
-        logger.debug(f"Profile {profile_name} does not exist, creating with defaults")
+        logger.debug("Profile %s does not exist, creating with defaults", profile_name)
         # Create new profile with defaults if it doesn't exist
-        save_config(DEFAULT_CONFIG.copy(), profile_name)
-        return DEFAULT_CONFIG.copy()
+        config = default_config()
+        save_config(config, profile_name)
+        return config
 
     try:
+        st = config_path.stat()
+        cached = _PROFILE_CACHE.get(config_path)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return copy.deepcopy(cached[2])
+
         with config_path.open() as f:
-            user_config = yaml.safe_load(f) or {}
-            logger.debug(f"Loaded profile {profile_name}: {user_config}")
-            return user_config
+            user_config = yaml.load(f, Loader=SafeLoader) or {}
+            logger.debug("Loaded profile %s: %s", profile_name, user_config)
+        _cache_profile(config_path, copy.deepcopy(user_config))
+        return user_config
     except (OSError, yaml.YAMLError) as e:
         # If the file exists but is invalid, return empty dict
-        logger.warning(f"Failed to load profile {profile_name}: {e}")
+        logger.warning("Failed to load profile %s: %s", profile_name, e)
         return {}
 
 
@@ -134,27 +261,21 @@ def load_config(profile_name: str | None = None) -> dict[str, Any]:
         profile_name = get_active_profile()
 
     # Start with defaults
-    config = DEFAULT_CONFIG.copy()
-    logger.debug(f"Starting with default config: {config}")
+    config = default_config()
+    logger.debug("Starting with default config: %s", config)
 
     # Override with profile config
     user_config = load_profile_config(profile_name)
     config.update(user_config)
-    logger.debug(f"After profile {profile_name} config: {config}")
-
-    # Override with environment variables if present
-    if os.environ.get("API_BASE_URL"):
-        config["api_base_url"] = os.environ.get("API_BASE_URL")
-    if os.environ.get("API_MODEL"):
-        config["model"] = os.environ.get("API_MODEL")
-    if os.environ.get("API_MAX_TOKENS"):
-        config["max_tokens"] = int(os.environ.get("API_MAX_TOKENS", "1000"))
-    if os.environ.get("API_TEMPERATURE"):
-        config["temperature"] = float(os.environ.get("API_TEMPERATURE", "0.7"))
-    if os.environ.get("SYSTEM_PROMPT"):
-        config["system_prompt"] = os.environ.get("SYSTEM_PROMPT")
-
-    logger.debug(f"After env vars: {config}")
+    logger.debug("After profile %s config: %s", profile_name, config)
+
+    # Override with environment variables if present (and not empty)
+    for env_var, key, convert in _ENV_OVERRIDES:
+        value = os.environ.get(env_var)
+        if value:
+            config[key] = convert(value)
+
+    logger.debug("After env vars: %s", config)
 
     # API key is required - check OPENAI_API_KEY first, then fall back to API_KEY
     config["api_key"] = get_api_key() or ""
@@ -174,7 +295,7 @@ def update_config(key: str, value: Any, profile_name: str | None = None) -> dict
         profile_name = get_active_profile()
 
     config = load_config(profile_name)
-    logger.debug(f"Updating config key '{key}' to '{value}' in profile '{profile_name}'")
+    logger.debug("Updating config key '%s' to '%s' in profile '%s'", key, value, profile_name)
     config[key] = value
     save_config(config, profile_name)
     return config
@@ -189,7 +310,8 @@ def delete_profile(profile_name: str) -> bool:
     config_path = get_profile_path(profile_name)
     if config_path.exists():
         config_path.unlink()
-        logger.debug(f"Deleted profile {profile_name}")
+        invalidate_profile_caches()
+        logger.debug("Deleted profile %s", profile_name)
 
         # If this was the active profile, switch to default
         if get_active_profile() == profile_name:
@@ -1,33 +1,160 @@
 """Data models for the terminal chatbot."""
 
+import sys
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import islice
 
 
-@dataclass
 class Message:
-    """Represents a chat message."""
+    """Represents a chat message.
 
-    role: str  # 'user', 'assistant', or 'system'
-    content: str
-    timestamp: datetime = field(default_factory=datetime.now)
+    Streamed text is added with append() and joined onto the content the next time
+    it is read, so growing a long response does not copy it on every piece.
+    """
 
+    # __weakref__ lets the UI keep per-message caches that do not outlive the message
+    __slots__ = (
+        "__weakref__",
+        "_api_dict",
+        "_chunks",
+        "_content",
+        "_created",
+        "_timestamp",
+        "role",
+    )
 
-@dataclass
+    def __init__(self, role: str, content: str, timestamp: datetime | None = None) -> None:
+        self.role = role  # 'user', 'assistant', or 'system'
+        self._content = content
+        self._chunks: list[str] = []
+        # The creation time is taken now but only turned into a datetime when needed
+        self._created = time.time()
+        self._timestamp = timestamp
+        self._api_dict: dict[str, str] | None = None
+
+    @property
+    def content(self) -> str:
+        """The message text, including any appended pieces."""
+        if self._chunks:
+            self._content += "".join(self._chunks)
+            self._chunks.clear()
+        return self._content
+
+    @content.setter
+    def content(self, value: str) -> None:
+        self._content = value
+        self._chunks.clear()
+
+    @property
+    def timestamp(self) -> datetime:
+        """When the message was created, as a local time."""
+        if self._timestamp is None:
+            self._timestamp = datetime.fromtimestamp(self._created)
+        return self._timestamp
+
+    @timestamp.setter
+    def timestamp(self, value: datetime) -> None:
+        self._timestamp = value
+
+    def append(self, text: str) -> None:
+        """Add text to the end of the message."""
+        self._chunks.append(text)
+
+    def as_api(self) -> dict[str, str]:
+        """Get the message in the format expected by the API.
+
+        The dict is reused until the role or content changes, so it should be treated
+        as read-only.
+        """
+        api_dict = self._api_dict
+        content = self.content
+        if (
+            api_dict is None
+            or api_dict["content"] is not content
+            or api_dict["role"] is not self.role
+        ):
+            api_dict = self._api_dict = {"role": self.role, "content": content}
+        return api_dict
+
+    def __repr__(self) -> str:
+        return (
+            f"Message(role={self.role!r}, content={self.content!r}, timestamp={self.timestamp!r})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Message):
+            return NotImplemented
+        return (self.role, self.content, self.timestamp) == (
+            other.role,
+            other.content,
+            other.timestamp,
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+@dataclass(slots=True)
 class Conversation:
     """Represents a conversation with message history."""
 
     messages: list[Message]
     title: str | None = None
+    # Index of the first system message, kept up to date by the methods below
+    system_index: int | None = field(default=None, init=False, repr=False, compare=False)
+    # Number of leading messages currently shown on screen; 0 requests a full redraw
+    rendered_count: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Locate the system message among the initial messages."""
+        self.system_index = next(
+            (i for i, msg in enumerate(self.messages) if msg.role == "system"), None
+        )
 
     def add_message(self, role: str, content: str) -> None:
         """Add a message to the conversation."""
+        # Every message of a role shares a single role string
+        role = sys.intern(role)
+        if role == "system" and self.system_index is None:
+            self.system_index = len(self.messages)
         self.messages.append(Message(role=role, content=content))
 
+    def set_system(self, content: str) -> None:
+        """Replace the system message's content, adding a system message if there is none."""
+        if self.system_index is None:
+            self.add_message("system", content)
+        else:
+            self.messages[self.system_index].content = content
+
+    def reset(self, system_prompt: str) -> None:
+        """Start a new conversation with the given system message."""
+        self.messages.clear()
+        self.system_index = None
+        self.rendered_count = 0
+        self.add_message("system", system_prompt)
+
     def to_api_format(self) -> list[dict[str, str]]:
-        """Convert conversation to format expected by API."""
-        return [{"role": msg.role, "content": msg.content} for msg in self.messages]
+        """Convert conversation to format expected by API.
+
+        Each message's entry is reused until that message changes, so the entries
+        should be treated as read-only.
+        """
+        return [msg.as_api() for msg in self.messages]
 
     def clear(self) -> None:
-        """Clear all messages except system messages."""
-        self.messages = [msg for msg in self.messages if msg.role == "system"]
+        """Clear all messages except system messages.
+
+        The list is emptied in place, so references to it stay valid.
+        """
+        messages = self.messages
+        kept = 0
+        while kept < len(messages) and messages[kept].role == "system":
+            kept += 1
+        if any(msg.role == "system" for msg in islice(messages, kept, None)):
+            # System messages added later in the conversation are kept too
+            messages[:] = [msg for msg in messages if msg.role == "system"]
+        else:
+            del messages[kept:]
+        self.system_index = 0 if self.messages else None
+        self.rendered_count = 0
@@ -1,123 +1,232 @@
 """UI components for the terminal chatbot."""
 
 import sys
+import weakref
 from collections.abc import Callable, Generator
 from contextlib import contextmanager
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
-from rich.console import Console, Group
-from rich.live import Live
-from rich.markdown import Markdown
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
+from rich.align import Align
+from rich.console import Group
 from rich.text import Text
 
 from mini_chat.models import Conversation, Message
-from mini_chat.utils import pause_after
+from mini_chat.utils import console, pause_after
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console, ConsoleOptions, RenderableType, RenderResult
+    from rich.live import Live
+    from rich.markdown import Markdown
+    from rich.progress import Progress
 
+# Heading shown above the conversation when the screen is redrawn
+_TITLE = Align.center(Text("mini-chat", style="bold"))
 
-def create_message_display(message: Message) -> Text | Markdown:
-    """Create formatted text for message display."""
+# Hint shown below the conversation
+_FOOTER = Text("Type your message below. Use /help for commands.", style="dim")
+
+# Role labels and spacing, shared by every message displayed
+_USER_LABEL = Text("User: ", style="bold blue")
+_ASSISTANT_LABEL = Text("Assistant: ", style="bold green")
+_STREAMING_LABEL = Text("\nAssistant: ", style="bold green")
+_BLANK_LINE = Text("")
+
+# Label shown before a message of each role; system messages are not shown at all,
+# and any other role is labelled like the user
+_ROLE_LABELS: dict[str, Text | None] = {
+    "assistant": _ASSISTANT_LABEL,
+    "user": _USER_LABEL,
+    "system": None,
+}
+
+
+# Displays of messages already shown, keyed by message identity and reused until the
+# role or content changes; an entry is dropped when its message is garbage collected
+_DISPLAY_CACHE: dict[int, tuple[str, str, "Text | Markdown"]] = {}
+
+
+def _render_markdown(text: str) -> "Markdown":
+    """Parse text as Markdown."""
+    # Markdown pulls in markdown-it, so it is only imported once there is an
+    # assistant message to show
+    from rich.markdown import Markdown
+
+    return Markdown(text)
+
+
+def _build_message_display(message: Message) -> "Text | Markdown":
+    """Build the formatted text for a message."""
     if message.role == "assistant":
         # Use Markdown for assistant messages
-        content = Markdown(message.content)
-    else:
-        # Use plain text with styling for user
-        content = Text(message.content)
-        if message.role == "user":
-            content.stylize("blue")
+        return _render_markdown(message.content)
 
+    # Use plain text with styling for user
+    content = Text(message.content)
+    if message.role == "user":
+        content.stylize("blue")
     return content
 
 
+def create_message_display(message: Message, *, cache: bool = True) -> "Text | Markdown":
+    """Create formatted text for message display.
+
+    The result is reused for the same message while its content is unchanged, so a
+    redraw only formats new messages. Pass cache=False for text that will not be
+    shown again, such as a partially streamed response.
+    """
+    if not cache:
+        return _build_message_display(message)
+
+    key = id(message)
+    content = message.content
+    cached = _DISPLAY_CACHE.get(key)
+    if cached is not None and cached[0] is message.role and cached[1] is content:
+        return cached[2]
+
+    display = _build_message_display(message)
+    if cached is None:
+        weakref.finalize(message, _DISPLAY_CACHE.pop, key, None)
+    _DISPLAY_CACHE[key] = (message.role, content, display)
+    return display
+
+
 def display_conversation(conversation: Conversation) -> None:
-    """Display the entire conversation."""
-    console.clear()
-    console.print("[bold]mini-chat[/bold]", justify="center")
+    """Display the conversation.
 
-    for message in conversation.messages:
-        if message.role != "system":  # Don't show system messages
-            # Use consistent capitalization (User/Assistant)
-            display_role = "Assistant" if message.role == "assistant" else "User"
-            role_text = Text(f"{display_role}: ", style="bold")
-            if message.role == "assistant":
-                role_text.stylize("green")
-            else:
-                role_text.stylize("blue")
+    Messages already on screen, as recorded by conversation.rendered_count, are not
+    printed again; the screen is only cleared and fully redrawn when nothing is
+    recorded as shown or the conversation has shrunk since.
+    """
+    # Everything is collected into one Group so the screen is drawn in a single print
+    renderables: list[RenderableType] = []
+    start = conversation.rendered_count
+    if start == 0 or start > len(conversation.messages):
+        console.clear()
+        renderables.append(_TITLE)
+        start = 0
+    else:
+        renderables.append(_BLANK_LINE)  # Empty line after the last message shown
 
-            console.print(role_text)
-            console.print(create_message_display(message))
-            console.print("")  # Empty line between messages
+    for message in conversation.messages[start:]:
+        role_text = _ROLE_LABELS.get(message.role, _USER_LABEL)
+        if role_text is not None:  # Don't show system messages
+            renderables.append(role_text)
+            renderables.append(create_message_display(message))
+            renderables.append(_BLANK_LINE)  # Empty line between messages
 
-    console.print("Type your message below. Use /help for commands.", style="dim")
+    renderables.append(_FOOTER)
+    console.print(Group(*renderables))
+    conversation.rendered_count = len(conversation.messages)
 
 
 def get_user_input() -> str:
     """Get input from the user."""
     try:
-        # Create a consistent prompt that matches conversation display
-        role_text = Text("User: ", style="bold blue")
-        console.print(role_text)
-        return console.input()
+        # Use a prompt that matches the conversation display
+        console.print(_USER_LABEL)
+        # The label is already printed, so read the line directly rather than through
+        # Console.input; input() still gives readline editing when it is available
+        return input()
     except KeyboardInterrupt:
         console.print("\n[bold yellow]mini-chat terminated by user.[/bold yellow]")
         sys.exit(0)
 
 
-@contextmanager
-def create_loading_display(message: str = "Thinking") -> Generator[Progress, None, None]:
-    """Create a loading spinner display with context manager support."""
-    progress = Progress(
+@lru_cache(maxsize=1)
+def _get_loading_progress() -> "Progress":
+    """Create the loading spinner, once, when the first message is sent."""
+    # Progress is not needed until then, so it is imported here to keep it off the
+    # startup path
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    return Progress(
         SpinnerColumn(),
         TextColumn("[bold green]{task.description}[/bold green]"),
         transient=True,
+        console=console,
     )
-    _ = progress.add_task(message, total=None)
+
+
+@contextmanager
+def create_loading_display(message: str = "Thinking") -> Generator["Progress", None, None]:
+    """Create a loading spinner display with context manager support.
+
+    The same Progress is reused for every message; the task added for this display
+    is removed again on exit.
+    """
+    progress = _get_loading_progress()
+    task_id = progress.add_task(message, total=None)
 
     try:
         yield progress
     finally:
+        progress.remove_task(task_id)
         progress.stop()
 
 
-def handle_streaming_response(conversation: Conversation, live: Live) -> Callable[[str], None]:
+class _StreamingMessageView:
+    """Renderable showing a message as it is being streamed.
+
+    The message display is built when the Live display refreshes rather than on every
+    update, and reused until the content changes, so the accumulated text is parsed
+    as Markdown at most once per frame. The same view stays in the Live display for
+    the whole response.
+    """
+
+    __slots__ = ("_content", "_display", "message")
+
+    def __init__(self, message: Message) -> None:
+        self.message = message
+        self._content: str | None = None
+        self._display: Text | Markdown | None = None
+
+    def __rich_console__(self, console: "Console", options: "ConsoleOptions") -> "RenderResult":
+        if self._display is None or self._content is not self.message.content:
+            self._content = self.message.content
+            self._display = create_message_display(self.message, cache=False)
+        # Yielded one after the other, as a Group would render them
+        yield _STREAMING_LABEL
+        yield self._display
+
+
+def handle_streaming_response(conversation: Conversation, live: "Live") -> Callable[[str], None]:
     """Create a handler for streaming response that updates the given Live display.
 
+    The assistant message is appended to the conversation when the first content
+    arrives, so the display keeps its loading spinner until then and a request that
+    fails up front leaves no empty assistant turn behind.
+
     Args:
-        conversation: The conversation containing the messages
+        conversation: The conversation to add the assistant's response to
         live: The Live display to update
 
     Returns:
         A callback function that updates the display with new content
     """
-    # Get the last message (the assistant's response)
-    message = conversation.messages[-1]
-
-    # Create assistant label with consistent styling
-    role_text = Text("\nAssistant: ", style="bold green")
-
-    # Initially update the live display with empty content
-    content = create_message_display(message)
-    live.update(Group(role_text, content))
+    view: _StreamingMessageView | None = None
 
     # Return a function that updates the content
     def update_content(new_content: str) -> None:
-        # Update the actual message object's content
-        conversation.messages[-1].content += new_content
-        # Create a new Markdown instance with the complete content to ensure consistent rendering
-        content = create_message_display(conversation.messages[-1])
-        live.update(Group(role_text, content))
+        nonlocal view
+        if view is None:
+            # Start the assistant's response with the first piece of content, replacing
+            # the spinner; from then on Live redraws the view at its own refresh rate
+            conversation.add_message("assistant", new_content)
+            view = _StreamingMessageView(conversation.messages[-1])
+            live.update(view)
+        else:
+            # Update the actual message object's content; the view shows it on the
+            # next refresh, so there is nothing to render here
+            view.message.append(new_content)
 
     return update_content
 
 
-@pause_after
-def show_help() -> None:
-    """Display help information."""
-    # Create a nicely formatted title
-    console.print("\n[bold]mini-chat Help[/bold]", style="bold green", justify="center")
-    console.print("Available commands are listed below\n", style="italic", justify="center")
+@lru_cache(maxsize=1)
+def _build_help_screen() -> Group:
+    """Build the help screen, once, on the first /help."""
+    from rich.table import Table
 
     table = Table(show_header=True, header_style="bold magenta")
     table.add_column("Command", style="bold blue")
@@ -142,11 +251,20 @@ def show_help() -> None:
     table.add_row("/profile", "Show current profile")
     table.add_row("/profile use <name>", "Switch to a different profile")
 
-    # Note about profile management
-    console.print(
-        "\n[italic]Note: Profile files can be managed manually in "
-        "~/.config/mini-chat/profiles/[/italic]"
+    return Group(
+        Align.center(Text.from_markup("\n[bold]mini-chat Help[/bold]", style="bold green")),
+        Align.center(Text("Available commands are listed below\n", style="italic")),
+        # Note about profile management
+        Text.from_markup(
+            "\n[italic]Note: Profile files can be managed manually in "
+            "~/.config/mini-chat/profiles/[/italic]"
+        ),
+        table,
     )
 
-    # Print the table to the terminal using the console object
-    console.print(table)
+
+@pause_after
+def show_help() -> None:
+    """Display help information."""
+    # Title, profile note and command table are rendered in a single pass
+    console.print(_build_help_screen())
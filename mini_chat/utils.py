@@ -2,38 +2,102 @@
 
 import signal
 import sys
-from typing import Any
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from functools import wraps
+from typing import TYPE_CHECKING, Any, ParamSpec, Protocol, TypeVar, overload
 
 from rich.console import Console
-from rich.progress import Progress
 
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from rich.progress import Progress
+
+# Console shared by every module, so the terminal is only probed once
 console = Console()
 
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+
+
+# pytest and unittest use KeyboardInterrupt for control flow, so the handler is
+# only registered in non-test environments
+_ENABLE_SIGNAL_HANDLER = "pytest" not in sys.modules
+
+# Whether the Ctrl+C handler has been registered by setup_signal_handler
+_signal_handler_installed = False
+
+
+def _handle_sigint(sig: int, frame: Any) -> None:
+    """Handle keyboard interrupt signal."""
+    console.print("\n[bold yellow]mini-chat terminated by user.[/bold yellow]")
+    sys.exit(0)
+
 
 def setup_signal_handler() -> None:
-    """Set up signal handler for clean exit with Ctrl+C."""
+    """Set up signal handler for clean exit with Ctrl+C.
 
-    def signal_handler(sig: int, frame: Any) -> None:
-        """Handle keyboard interrupt signal."""
-        console.print("\n[bold yellow]mini-chat terminated by user.[/bold yellow]")
-        sys.exit(0)
+    Calling this again once the handler is registered does nothing.
+    """
+    global _signal_handler_installed
+    if _signal_handler_installed or not _ENABLE_SIGNAL_HANDLER:
+        return
 
-    # Only register in non-test environments
-    # pytest and unittest use KeyboardInterrupt for control flow
-    if "pytest" not in sys.modules:
-        # Register the signal handler
-        signal.signal(signal.SIGINT, signal_handler)
+    # Register the signal handler
+    signal.signal(signal.SIGINT, _handle_sigint)
+    _signal_handler_installed = True
 
 
-def create_progress_bar(desc: str) -> Progress:
+def create_progress_bar(desc: str) -> "Progress":
     """Create a progress bar with the given description."""
+    from rich.progress import Progress
+
     progress = Progress()
     _ = progress.add_task(desc, total=None)
     return progress
 
 
-class PauseAfter:
-    """Context manager and decorator that pauses execution and waits for user input.
+def _pause() -> None:
+    """Wait for the user to press Enter."""
+    console.print("\n[dim]Press Enter to continue...[/dim]")
+    input()
+
+
+class _PauseBlock(Protocol):
+    """What pause_after() returns: a block that pauses on exit, also usable as a decorator."""
+
+    def __enter__(self) -> None: ...
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: "TracebackType | None",
+    ) -> bool | None: ...
+
+    def __call__(self, func: Callable[_P, _R]) -> Callable[_P, _R]: ...
+
+
+@contextmanager
+def _pause_block() -> Generator[None, None, None]:
+    """Pause once the block exits, even if it raised."""
+    try:
+        yield
+    finally:
+        _pause()
+
+
+@overload
+def pause_after(func: Callable[_P, _R]) -> Callable[_P, _R]: ...
+
+
+@overload
+def pause_after(func: None = None) -> _PauseBlock: ...
+
+
+def pause_after(func: Callable[_P, _R] | None = None) -> Callable[_P, _R] | _PauseBlock:
+    """Pause execution and wait for user input after a function or block.
 
     Can be used either as a decorator:
 
@@ -48,38 +112,14 @@ class PauseAfter:
         # Block of code here
         print("This block will pause after execution")
     """
-
-    def __init__(self, func=None):
-        """Initialize as either a decorator or context manager."""
-        self.func = func
-
-    def __call__(self, *args, **kwargs):
-        """Called when used as a decorator."""
-        if self.func is None:
-            # Being called with a function argument
-            self.func = args[0]
-            return self
-
-        # Execute the wrapped function
-        result = self.func(*args, **kwargs)
-        self._pause()
+    if func is None:
+        return _pause_block()
+
+    @wraps(func)
+    def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _R:
+        # Pause only once the function has returned normally
+        result = func(*args, **kwargs)
+        _pause()
         return result
 
-    def __enter__(self):
-        """Enter the context manager."""
-        return self
-
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        """Exit the context manager and pause."""
-        self._pause()
-        # Don't suppress exceptions
-        return False
-
-    def _pause(self):
-        """Common pause functionality."""
-        console.print("\n[dim]Press Enter to continue...[/dim]")
-        input()
-
-
-# For backward compatibility and to maintain the decorator syntax
-pause_after = PauseAfter
+    return wrapper
@@ -7,6 +7,8 @@ from unittest.mock import patch
 
 import pytest
 
+from mini_chat.api import invalidate_config_cache
+from mini_chat.config import invalidate_profile_caches
 from mini_chat.models import Conversation, Message
 
 
@@ -39,3 +41,13 @@ def mock_environment():
     """Mock environment variables for tests."""
     with patch.dict(os.environ, {"API_KEY": "test_api_key"}, clear=False):
         yield
+
+
+@pytest.fixture(autouse=True)
+def reset_caches():
+    """Ensure each test starts without cached configuration or profile lookups."""
+    invalidate_config_cache()
+    invalidate_profile_caches()
+    yield
+    invalidate_config_cache()
+    invalidate_profile_caches()
@@ -1,11 +1,20 @@
 """Tests for the api module."""
 
+import json
 from unittest.mock import MagicMock, patch
 
 import pytest
-from requests.exceptions import RequestException
-
-from mini_chat.api import APIError, _send_request, send_message
+import requests
+import responses
+
+from mini_chat.api import (
+    APIError,
+    _iter_content_deltas,
+    _send_request,
+    _stream_response,
+    invalidate_config_cache,
+    send_message,
+)
 from mini_chat.models import Conversation, Message
 
 
@@ -30,16 +39,19 @@ def mock_config():
     }
 
 
-@patch("mini_chat.api.load_config")
-@patch("mini_chat.api.get_api_key")
+@pytest.fixture(autouse=True)
+def mock_load_config(monkeypatch, mock_config):
+    """Serve the mock configuration and a test API key to the api module."""
+    load_config = MagicMock(return_value=mock_config)
+    monkeypatch.setattr("mini_chat.api.load_config", load_config)
+    monkeypatch.setattr("mini_chat.api.get_api_key", lambda: "test-api-key")
+    return load_config
+
+
 @patch("mini_chat.api._send_request")
-def test_send_message_non_streaming(
-    mock_send_request, mock_get_api_key, mock_load_config, mock_conversation, mock_config
-):
+def test_send_message_non_streaming(mock_send_request, mock_conversation):
     """Test sending a message without streaming."""
     # Configure mocks
-    mock_load_config.return_value = mock_config
-    mock_get_api_key.return_value = "test-api-key"
     mock_send_request.return_value = "Test response"
 
     # Call function
@@ -62,16 +74,10 @@ def test_send_message_non_streaming(
     assert len(data["messages"]) == 2
 
 
-@patch("mini_chat.api.load_config")
-@patch("mini_chat.api.get_api_key")
 @patch("mini_chat.api._stream_response")
-def test_send_message_streaming(
-    mock_stream_response, mock_get_api_key, mock_load_config, mock_conversation, mock_config
-):
+def test_send_message_streaming(mock_stream_response, mock_conversation):
     """Test sending a message with streaming."""
     # Configure mocks
-    mock_load_config.return_value = mock_config
-    mock_get_api_key.return_value = "test-api-key"
     mock_stream_response.return_value = "Streamed response"
 
     # Callback for streaming
@@ -91,25 +97,52 @@ def test_send_message_streaming(
     assert args[3] == on_content
 
 
-@patch("mini_chat.api.get_api_key")
-def test_send_message_missing_api_key(mock_get_api_key, mock_conversation):
+@patch("mini_chat.api._send_request")
+def test_send_message_caches_config(mock_send_request, mock_load_config, mock_conversation):
+    """Test that the config is loaded once and reloaded after invalidation."""
+    mock_send_request.return_value = "Test response"
+
+    send_message(mock_conversation)
+    send_message(mock_conversation)
+    assert mock_load_config.call_count == 1
+
+    # Headers are built once and reused while the key is unchanged
+    first_headers = mock_send_request.call_args_list[0][0][0]
+    assert mock_send_request.call_args_list[1][0][0] is first_headers
+
+    # The request body is reused as well
+    first_data = mock_send_request.call_args_list[0][0][1]
+    assert mock_send_request.call_args_list[1][0][1] is first_data
+
+    invalidate_config_cache()
+    send_message(mock_conversation)
+    assert mock_load_config.call_count == 2
+    assert mock_send_request.call_args[0][1] is not first_data
+
+
+def test_send_message_missing_api_key(monkeypatch, mock_conversation):
     """Test sending a message with missing API key."""
-    # Configure mocks
-    mock_get_api_key.return_value = None
+    monkeypatch.setattr("mini_chat.api.get_api_key", lambda: None)
 
     # Expect APIError when API key is missing
     with pytest.raises(APIError, match="API key not found"):
         send_message(mock_conversation)
 
 
-@patch("requests.post")
-def test_send_request_success(mock_post):
+# URL the _send_request tests post to
+_COMPLETIONS_URL = "https://test-api.example.com/v1/chat/completions"
+
+
+@responses.activate
+def test_send_request_success():
     """Test successful API request."""
     # Configure mock response
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {"choices": [{"message": {"content": "Test response"}}]}
-    mock_post.return_value = mock_response
+    responses.add(
+        responses.POST,
+        _COMPLETIONS_URL,
+        json={"choices": [{"message": {"content": "Test response"}}]},
+        status=200,
+    )
 
     # Test parameters
     headers = {"Authorization": "Bearer test-key"}
@@ -123,19 +156,18 @@ def test_send_request_success(mock_post):
     assert response == "Test response"
 
     # Verify API was called correctly
-    mock_post.assert_called_once_with(
-        "https://test-api.example.com/v1/chat/completions", headers=headers, json=data, timeout=30
-    )
+    assert len(responses.calls) == 1
+    request = responses.calls[0].request
+    assert request.headers["Authorization"] == "Bearer test-key"
+    assert json.loads(request.body) == data
+    assert request.req_kwargs["timeout"] == (5, 30)
 
 
-@patch("requests.post")
-def test_send_request_error(mock_post):
+@responses.activate
+def test_send_request_error():
     """Test API request with error."""
     # Configure mock response
-    mock_response = MagicMock()
-    mock_response.status_code = 401
-    mock_response.text = "Unauthorized"
-    mock_post.return_value = mock_response
+    responses.add(responses.POST, _COMPLETIONS_URL, body="Unauthorized", status=401)
 
     # Test parameters
     headers = {"Authorization": "Bearer test-key"}
@@ -143,15 +175,24 @@ def test_send_request_error(mock_post):
     base_url = "https://test-api.example.com/v1"
 
     # Expect APIError due to non-200 status code
-    with pytest.raises(APIError, match="API returned error 401"):
+    with pytest.raises(APIError, match="API returned error 401: Unauthorized"):
         _send_request(headers, data, base_url)
 
 
-@patch("requests.post")
-def test_send_request_network_error(mock_post):
+@responses.activate
+def test_send_request_invalid_json():
+    """Test API request with a malformed response body."""
+    responses.add(responses.POST, _COMPLETIONS_URL, body="<html>Bad gateway</html>", status=200)
+
+    with pytest.raises(APIError, match="invalid JSON"):
+        _send_request({}, {"model": "test-model"}, "https://test-api.example.com/v1")
+
+
+@responses.activate
+def test_send_request_network_error():
     """Test API request with network error."""
     # Configure mock to raise exception
-    mock_post.side_effect = RequestException("Network error")
+    responses.add(responses.POST, _COMPLETIONS_URL, body=requests.ConnectionError("Network error"))
 
     # Test parameters
     headers = {"Authorization": "Bearer test-key"}
@@ -161,3 +202,69 @@ def test_send_request_network_error(mock_post):
     # Expect APIError due to network error
     with pytest.raises(APIError, match="API request failed"):
         _send_request(headers, data, base_url)
+
+
+@patch("mini_chat.api._SESSION.post")
+def test_stream_response(mock_post):
+    """Test streaming response chunks are passed to the callback and joined."""
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    lines = [
+        b'data: {"choices":[{"delta":{"role":"assistant"}}]}',
+        b"",
+        b'data: {"choices":[{"delta":{"content":"Hello"}}]}',
+        b"data: {not json",
+        b'data: {"choices":[{"delta":{"content":" world"}}]}',
+        b'data: {"choices":[{"delta":{"content":", \\"caf\\u00e9\\""}}]}',
+        b'data: {"choices":[{"delta":{},"finish_reason":"stop"}]}',
+        b"data: [DONE]",
+    ]
+    body = b"\r\n".join(lines) + b"\r\n"
+    # Deliver the body in uneven chunks so lines are split across reads
+    mock_response.iter_content.return_value = [body[i : i + 7] for i in range(0, len(body), 7)]
+    mock_response.__enter__.return_value = mock_response
+    mock_post.return_value = mock_response
+    on_content = MagicMock()
+
+    response = _stream_response({}, {}, "https://test-api.example.com/v1", on_content)
+
+    assert response == 'Hello world, "café"'
+
+    # Every delta is passed on as soon as it is parsed
+    assert [call.args[0] for call in on_content.call_args_list] == [
+        "Hello",
+        " world",
+        ', "café"',
+    ]
+
+    # The response is closed once the stream is consumed
+    mock_response.__exit__.assert_called_once()
+
+
+def test_iter_content_deltas():
+    """Test extracting delta texts from stream lines."""
+    lines = [
+        b": keep-alive",
+        b"",
+        b'data: {"choices":[{"delta":{"role":"assistant"}}]}',
+        b'data: {"choices":[{"delta":{"content":"Hi"}}]}',
+        b'data: {"choices":[{"delta":{"content":"\\u00e9"}}]}',
+        b"data: not json",
+        b"data: [DONE]",
+        b'data: {"choices":[{"delta":{"content":"ignored"}}]}',
+    ]
+
+    assert list(_iter_content_deltas(lines)) == ["Hi", "\u00e9"]
+
+
+def test_session_pools_and_retries():
+    """Test that the shared session pools connections and retries only failed connects."""
+    from mini_chat.api import _SESSION
+
+    adapter = _SESSION.get_adapter("https://test-api.example.com/v1")
+    retry = adapter.max_retries
+    assert retry.connect == 2
+    assert retry.read is False
+    assert retry.status == 0
+    assert retry.respect_retry_after_header is False
+    assert _SESSION.get_adapter("http://localhost:8000/v1") is adapter
@@ -1,8 +1,8 @@
 """Tests for the config module."""
 
 import os
-import pathlib
-import tempfile
+import shutil
+import stat
 from unittest.mock import patch
 
 import pytest
@@ -10,25 +10,39 @@ import yaml
 
 from mini_chat.config import (
     DEFAULT_CONFIG,
+    default_config,
     ensure_config_dirs,
     get_active_profile,
     get_api_key,
     get_profile_path,
+    list_available_profiles,
     load_config,
+    load_profile_config,
+    save_config,
+    set_active_profile,
 )
 
 
+@pytest.fixture(scope="session")
+def _config_root(tmp_path_factory):
+    """Create one temporary directory for config files, shared by every test."""
+    return tmp_path_factory.mktemp("config")
+
+
 @pytest.fixture
-def temp_config_dir():
-    """Create a temporary directory for config files."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        tmp_path = pathlib.Path(tmp_dir)
-        with (
-            patch("mini_chat.config.USER_CONFIG_DIR", tmp_path),
-            patch("mini_chat.config.CONFIG_PROFILES_DIR", tmp_path / "profiles"),
-            patch("mini_chat.config.ACTIVE_PROFILE_FILE", tmp_path / "active_profile.txt"),
-        ):
-            yield tmp_path
+def temp_config_dir(_config_root, monkeypatch):
+    """Point the config module at the shared temporary directory, emptied after each test."""
+    monkeypatch.setattr("mini_chat.config.USER_CONFIG_DIR", _config_root)
+    monkeypatch.setattr("mini_chat.config.CONFIG_PROFILES_DIR", _config_root / "profiles")
+    monkeypatch.setattr("mini_chat.config.ACTIVE_PROFILE_FILE", _config_root / "active_profile.txt")
+    yield _config_root
+
+    # Leave nothing behind for the next test
+    for path in _config_root.iterdir():
+        if path.is_dir():
+            shutil.rmtree(path)
+        else:
+            path.unlink()
 
 
 def test_ensure_config_dirs(temp_config_dir):
@@ -41,6 +55,19 @@ def test_ensure_config_dirs(temp_config_dir):
     assert profiles_dir.exists()
 
 
+def test_default_config():
+    """Test that each default config is a separate dict."""
+    config = default_config()
+    assert config == DEFAULT_CONFIG
+
+    config["model"] = "changed"
+    assert default_config()["model"] == DEFAULT_CONFIG["model"]
+
+    # The defaults themselves cannot be changed
+    with pytest.raises(TypeError):
+        DEFAULT_CONFIG["model"] = "changed"  # type: ignore[index]
+
+
 def test_get_profile_path():
     """Test getting a profile path."""
     path = get_profile_path("test_profile")
@@ -62,6 +89,78 @@ def test_get_active_profile(temp_config_dir):
     assert active_profile_file.read_text().strip() == "default"
 
 
+def test_set_active_profile(temp_config_dir):
+    """Test that the active profile file is only rewritten when it changes."""
+    set_active_profile("work")
+    assert (temp_config_dir / "active_profile.txt").read_text() == "work"
+    assert get_active_profile() == "work"
+
+    with patch("mini_chat.config._write_text_atomic") as mock_write:
+        set_active_profile("work")
+        mock_write.assert_not_called()
+
+    # No temporary files are left behind
+    assert not list(temp_config_dir.glob(".active_profile.txt.*"))
+
+
+def test_set_active_profile_keeps_file_mode(temp_config_dir):
+    """Test that rewriting the active profile file does not change its permissions."""
+    active_file = temp_config_dir / "active_profile.txt"
+    umask = os.umask(0)
+    os.umask(umask)
+
+    # A new file gets the usual mode for the umask, not mkstemp's owner-only mode
+    set_active_profile("work")
+    assert stat.S_IMODE(active_file.stat().st_mode) == 0o666 & ~umask
+
+    # An existing file keeps the mode it has
+    active_file.chmod(0o640)
+    set_active_profile("home")
+    assert stat.S_IMODE(active_file.stat().st_mode) == 0o640
+
+
+def test_profile_lookups_are_cached(temp_config_dir):
+    """Test that cached profile lookups reflect profile changes."""
+    assert get_active_profile() == "default"
+    assert list_available_profiles() == ["default"]
+
+    # Changes made through the module invalidate the caches
+    set_active_profile("work")
+    save_config(DEFAULT_CONFIG.copy(), "work")
+    assert get_active_profile() == "work"
+    assert list_available_profiles() == ["default", "work"]
+
+    # Profiles added outside mini-chat are listed
+    (temp_config_dir / "profiles" / "extra.yaml").write_text("model: extra\n")
+    assert list_available_profiles() == ["default", "extra", "work"]
+
+    # Edits to the active profile are noticed through the file's mtime
+    active_file = temp_config_dir / "active_profile.txt"
+    active_file.write_text("home")
+    mtime = active_file.stat().st_mtime_ns + 1_000_000_000
+    os.utime(active_file, ns=(mtime, mtime))
+    assert get_active_profile() == "home"
+
+
+def test_load_profile_config_is_cached(temp_config_dir):
+    """Test that parsed profiles are reused until the file changes."""
+    save_config({"model": "cached-model"}, "test_profile")
+
+    with patch("mini_chat.config.yaml.load") as mock_load:
+        config = load_profile_config("test_profile")
+        assert config == {"model": "cached-model"}
+        mock_load.assert_not_called()
+
+    # Callers get their own copy
+    config["model"] = "changed"
+    assert load_profile_config("test_profile")["model"] == "cached-model"
+
+    # Writing the file outside the module is picked up
+    with get_profile_path("test_profile").open("w") as f:
+        yaml.dump({"model": "other-model-name"}, f)
+    assert load_profile_config("test_profile") == {"model": "other-model-name"}
+
+
 def test_load_config_default(temp_config_dir):
     """Test loading the default config."""
     config = load_config()
@@ -89,6 +188,19 @@ def test_load_config_with_profile(temp_config_dir):
         assert config["model"] == "test-model"
 
 
+@patch.dict(
+    os.environ,
+    {"API_MODEL": "env-model", "API_MAX_TOKENS": "42", "API_TEMPERATURE": "", "API_KEY": "k"},
+    clear=True,
+)
+def test_load_config_env_overrides(temp_config_dir):
+    """Test that non-empty environment variables override the config."""
+    config = load_config()
+    assert config["model"] == "env-model"
+    assert config["max_tokens"] == 42
+    assert config["temperature"] == DEFAULT_CONFIG["temperature"]
+
+
 @patch.dict(os.environ, {"API_KEY": "test-api-key"}, clear=True)
 def test_get_api_key_from_env():
     """Test getting API key from environment variable."""
@@ -6,20 +6,28 @@ import pytest
 
 from mini_chat.__main__ import main
 from mini_chat.cli import process_command, show_config
-from mini_chat.models import Conversation, Message
+from mini_chat.models import Conversation
 
 
+@patch("mini_chat.__main__.close_session")
+@patch("mini_chat.__main__.process_command")
 @patch("mini_chat.__main__.setup_signal_handler")
 @patch("mini_chat.__main__.load_config")
 @patch("mini_chat.__main__.Conversation")
 @patch("mini_chat.__main__.display_conversation")
 @patch("mini_chat.__main__.get_user_input")
 def test_main_structure(
-    mock_get_input, mock_display, mock_conversation_class, mock_load_config, mock_setup_signal
+    mock_get_input,
+    mock_display,
+    mock_conversation_class,
+    mock_load_config,
+    mock_setup_signal,
+    mock_process_command,
+    mock_close_session,
 ):
     """Test main function initialization."""
-    # Set up KeyboardInterrupt to exit main loop
-    mock_get_input.side_effect = KeyboardInterrupt()
+    # Exit the main loop with the first command
+    mock_get_input.return_value = "/exit"
 
     # Mock conversation instance
     mock_conversation = MagicMock()
@@ -27,21 +35,81 @@ def test_main_structure(
 
     # Mock config
     mock_load_config.return_value = {"system_prompt": "Test system prompt", "api_key": "test_key"}
+    mock_process_command.return_value = (False, mock_load_config.return_value)
 
     # Run main and verify it exits properly
-    with pytest.raises(SystemExit):
-        main()
+    main()
 
     # Verify key functions were called
     mock_setup_signal.assert_called_once()
     mock_load_config.assert_called_once()
     mock_conversation.add_message.assert_called_with("system", "Test system prompt")
+    mock_process_command.assert_called_once_with(
+        "/exit", mock_conversation, mock_load_config.return_value
+    )
+
+    # The API connections are released on the way out
+    mock_close_session.assert_called_once()
 
 
 @patch("mini_chat.cli.console")
-def test_show_config(mock_console):
+@patch("mini_chat.__main__.Live")
+@patch("mini_chat.__main__.display_conversation")
+@patch("mini_chat.__main__.get_user_input")
+@patch("mini_chat.api._SESSION.post")
+def test_main_empty_response(
+    mock_post, mock_get_input, mock_display, mock_live_class, _, mock_config
+):
+    """Test that a streamed response without any content still ends the turn."""
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.iter_content.return_value = [b"data: [DONE]\n\n"]
+    mock_response.__enter__.return_value = mock_response
+    mock_post.return_value = mock_response
+    mock_live = mock_live_class.return_value.__enter__.return_value
+    mock_get_input.side_effect = ["Hello", "/exit"]
+
+    with (
+        patch("mini_chat.__main__.load_config", return_value=mock_config),
+        patch("mini_chat.api.load_config", return_value=mock_config),
+    ):
+        main()
+
+    # The spinner is replaced and an empty assistant turn follows the question
+    assert mock_live.update.call_args[0][0].plain == ""
+    conversation = mock_display.call_args[0][0]
+    assert [msg.role for msg in conversation.messages] == ["system", "user", "assistant"]
+    assert conversation.messages[-1].content == ""
+
+    # The conversation is redrawn before the next prompt
+    assert conversation.rendered_count == 0
+
+
+@pytest.fixture
+def mock_config():
+    """Create a configuration streaming from a test API."""
+    return {
+        "api_base_url": "https://test-api.example.com/v1",
+        "model": "test-model",
+        "max_tokens": 500,
+        "temperature": 0.5,
+        "system_prompt": "System prompt",
+    }
+
+
+@pytest.fixture
+def mock_console(monkeypatch):
+    """Replace the console the commands print to."""
+    console = MagicMock()
+    monkeypatch.setattr("mini_chat.cli.console", console)
+    return console
+
+
+def test_show_config(mock_console, monkeypatch):
     """Test displaying the configuration."""
     config = {"model": "test-model", "temperature": 0.7}
+    # Answer the "Press Enter to continue" prompt
+    monkeypatch.setattr("builtins.input", lambda *args: "")
 
     show_config(config)
 
@@ -49,62 +117,62 @@ def test_show_config(mock_console):
     assert mock_console.print.call_count >= 1
 
 
-def test_process_command_help():
-    """Test processing the help command."""
-    conversation = Conversation(messages=[])
+@pytest.mark.parametrize(
+    ("command", "expected_running", "expected_roles", "expected_output"),
+    [
+        ("/help", True, ["system", "user", "assistant"], None),
+        ("/exit", False, ["system", "user", "assistant"], "mini-chat exiting..."),
+        ("/clear", True, ["system"], "Conversation cleared."),
+    ],
+)
+def test_process_command_basic(
+    mock_console,
+    monkeypatch,
+    sample_conversation,
+    command,
+    expected_running,
+    expected_roles,
+    expected_output,
+):
+    """Test processing the commands that take no arguments."""
+    mock_show_help = MagicMock()
+    monkeypatch.setattr("mini_chat.cli.show_help", mock_show_help)
     config = {"model": "test-model"}
 
-    with patch("mini_chat.ui.console"), patch("mini_chat.cli.show_help") as mock_show_help:
-        running, new_config = process_command("/help", conversation, config)
-
-        # Help command should be processed
-        mock_show_help.assert_called_once()
+    running, new_config = process_command(command, sample_conversation, config)
 
-        # Chatbot should keep running after showing help
-        assert running is True
+    # Only /exit stops the chatbot
+    assert running is expected_running
 
-        # Config should be unchanged
-        assert new_config == config
+    # Only /clear drops messages, keeping the system message
+    assert [msg.role for msg in sample_conversation.messages] == expected_roles
 
+    # Help is shown through show_help; the other commands print a status line
+    if expected_output is None:
+        mock_show_help.assert_called_once()
+    else:
+        mock_show_help.assert_not_called()
+        mock_console.print.assert_called_with(f"[bold yellow]{expected_output}[/bold yellow]")
 
-def test_process_command_exit():
-    """Test processing the exit command."""
-    conversation = Conversation(messages=[])
-    config = {"model": "test-model"}
-
-    with patch("mini_chat.cli.console") as _:
-        running, new_config = process_command("/exit", conversation, config)
-
-        # Chatbot should stop running
-        assert running is False
-
-        # Config should be unchanged
-        assert new_config == config
+    # Config should be unchanged and not copied
+    assert new_config is config
 
 
-@patch("mini_chat.cli.console")
-def test_process_command_clear(mock_console):
-    """Test processing the clear command."""
-    # Create a conversation with messages
-    messages = [
-        Message(role="system", content="System prompt"),
-        Message(role="user", content="Hello"),
-        Message(role="assistant", content="Hi there"),
-    ]
-    conversation = Conversation(messages=messages)
+def test_process_command_config_set(mock_console, monkeypatch):
+    """Test that /config converts values to the type of the default."""
+    conversation = Conversation(messages=[])
     config = {"model": "test-model"}
+    mock_update_config = MagicMock(side_effect=lambda key, value: {**config, key: value})
+    monkeypatch.setattr("mini_chat.cli.update_config", mock_update_config)
 
-    running, new_config = process_command("/clear", conversation, config)
-
-    # Conversation should be cleared (except system message)
-    assert len(conversation.messages) == 1
-    assert conversation.messages[0].role == "system"
+    process_command("/config max_tokens = 200", conversation, config)
+    mock_update_config.assert_called_with("max_tokens", 200)
 
-    # Console should show a message
-    mock_console.print.assert_called_with("[bold yellow]Conversation cleared.[/bold yellow]")
+    process_command("/config\ttemperature=0.2", conversation, config)
+    mock_update_config.assert_called_with("temperature", 0.2)
 
-    # Chatbot should keep running
-    assert running is True
+    process_command("/config stream=No", conversation, config)
+    mock_update_config.assert_called_with("stream", False)
 
-    # Config should be unchanged
-    assert new_config == config
+    process_command("/config custom=1", conversation, config)
+    mock_update_config.assert_called_with("custom", "1")
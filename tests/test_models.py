@@ -56,6 +56,22 @@ def test_to_api_format():
     assert api_format[2]["content"] == "Hi there"
 
 
+def test_to_api_format_tracks_changes():
+    """Test that cached API entries follow added and updated messages."""
+    conversation = Conversation(messages=[Message(role="system", content="System prompt")])
+    first = conversation.to_api_format()
+
+    conversation.add_message("assistant", "")
+    conversation.messages[-1].content += "Hi there"
+    api_format = conversation.to_api_format()
+
+    assert api_format[0] is first[0]
+    assert api_format[1] == {"role": "assistant", "content": "Hi there"}
+
+    conversation.clear()
+    assert conversation.to_api_format() == [{"role": "system", "content": "System prompt"}]
+
+
 def test_clear_messages():
     """Test clearing messages from a conversation."""
     messages = [
@@ -71,3 +87,75 @@ def test_clear_messages():
     assert len(conversation.messages) == 1
     assert conversation.messages[0].role == "system"
     assert conversation.messages[0].content == "System prompt"
+
+    # The list is cleared in place
+    assert conversation.messages is messages
+
+    # System messages added later are kept as well
+    conversation.add_message("user", "Hello again")
+    conversation.add_message("system", "Another prompt")
+    conversation.add_message("assistant", "Hi")
+    conversation.clear()
+    assert [msg.content for msg in conversation.messages] == ["System prompt", "Another prompt"]
+
+
+def test_system_index():
+    """Test that the system message index follows conversation changes."""
+    conversation = Conversation(
+        messages=[
+            Message(role="user", content="Hello"),
+            Message(role="system", content="System prompt"),
+        ]
+    )
+    assert conversation.system_index == 1
+
+    conversation.clear()
+    assert conversation.system_index == 0
+
+    conversation.reset("New prompt")
+    assert conversation.system_index == 0
+    assert conversation.messages[0].content == "New prompt"
+
+    empty = Conversation(messages=[])
+    assert empty.system_index is None
+    empty.add_message("user", "Hi")
+    empty.add_message("system", "Prompt")
+    assert empty.system_index == 1
+
+
+def test_set_system():
+    """Test replacing or adding the system message."""
+    conversation = Conversation(messages=[Message(role="user", content="Hello")])
+
+    conversation.set_system("First prompt")
+    assert conversation.messages[-1].role == "system"
+    assert conversation.system_index == 1
+
+    conversation.set_system("Second prompt")
+    assert len(conversation.messages) == 2
+    assert conversation.messages[1].content == "Second prompt"
+
+
+def test_message_roles_are_shared():
+    """Test that the models use slots and messages share their role strings."""
+    conversation = Conversation(messages=[])
+    conversation.add_message("".join(["us", "er"]), "Hello")
+    conversation.add_message("user", "Again")
+
+    assert not hasattr(conversation, "__dict__")
+    assert not hasattr(conversation.messages[0], "__dict__")
+    assert conversation.messages[0].role is conversation.messages[1].role
+
+
+def test_message_append():
+    """Test appending streamed text to a message."""
+    message = Message(role="assistant", content="Hello")
+    message.append(",")
+    message.append(" world")
+    assert message.content == "Hello, world"
+
+    # Setting the content replaces any appended text
+    message.append("!")
+    message.content = "Replaced"
+    assert message.content == "Replaced"
+    assert message == Message(role="assistant", content="Replaced", timestamp=message.timestamp)
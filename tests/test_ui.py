@@ -1,9 +1,10 @@
 """Tests for the ui module."""
 
+import io
 from unittest.mock import MagicMock, patch
 
 import pytest
-from rich.console import Console
+from rich.console import Console, Group
 from rich.markdown import Markdown
 from rich.progress import Progress
 from rich.text import Text
@@ -12,12 +13,6 @@ from mini_chat.models import Conversation, Message
 from mini_chat.ui import create_loading_display, create_message_display, handle_streaming_response
 
 
-@pytest.fixture
-def mock_console():
-    """Create a mock console."""
-    return MagicMock(spec=Console)
-
-
 @pytest.fixture
 def mock_conversation():
     """Create a test conversation."""
@@ -49,6 +44,27 @@ def test_create_message_display_assistant():
     assert isinstance(result, Markdown)
     assert "# Hello" in result.markup
 
+    # The parsed Markdown is reused for the same message unless caching is disabled
+    assert create_message_display(message) is result
+    assert create_message_display(message, cache=False) is not result
+
+    # A change to the content is picked up
+    message.append(" Fine.")
+    assert "Fine." in create_message_display(message).markup
+
+
+def test_message_display_cache_follows_message():
+    """Test that a cached display is dropped along with its message."""
+    from mini_chat.ui import _DISPLAY_CACHE
+
+    message = Message(role="user", content="Hello")
+    create_message_display(message)
+    key = id(message)
+    assert key in _DISPLAY_CACHE
+
+    del message
+    assert key not in _DISPLAY_CACHE
+
 
 @patch("mini_chat.ui.console")
 def test_display_conversation(mock_console, mock_conversation):
@@ -60,18 +76,42 @@ def test_display_conversation(mock_console, mock_conversation):
     # Check console clear was called
     mock_console.clear.assert_called_once()
 
-    # Should print the title
-    mock_console.print.assert_any_call("[bold]Terminal Chatbot[/bold]", justify="center")
+    # The whole screen is printed at once
+    mock_console.print.assert_called_once()
+    (group,) = mock_console.print.call_args[0]
+    assert isinstance(group, Group)
+    texts = [r.plain for r in group.renderables if isinstance(r, Text)]
 
-    # Should have printed user and assistant messages (2 calls per message)
-    # Plus title and footer message = 5 calls minimum
-    assert mock_console.print.call_count >= 5
+    # Should show the title above the user and assistant messages and the footer
+    assert group.renderables[0].renderable.plain == "mini-chat"
+    assert "Hello" in texts
+    assert texts[-1].startswith("Type your message below")
 
     # System message should not be displayed
-    for call in mock_console.print.call_args_list:
-        args = call[0]
-        if len(args) > 0 and isinstance(args[0], Text):
-            assert "System" not in args[0].plain
+    assert not any("System" in text for text in texts)
+
+
+@patch("mini_chat.ui.console")
+def test_display_conversation_incremental(mock_console, mock_conversation):
+    """Test that only messages not yet shown are printed."""
+    from mini_chat.ui import display_conversation
+
+    display_conversation(mock_conversation)
+    assert mock_conversation.rendered_count == 3
+
+    # A new message is printed without clearing the screen
+    mock_console.reset_mock()
+    mock_conversation.add_message("user", "Another question")
+    display_conversation(mock_conversation)
+    mock_console.clear.assert_not_called()
+    printed = mock_console.print.call_args[0][0].renderables
+    assert any(isinstance(r, Text) and r.plain == "Another question" for r in printed)
+    assert not any(isinstance(r, Text) and r.plain == "Hello" for r in printed)
+
+    # Clearing the conversation redraws the screen
+    mock_conversation.clear()
+    display_conversation(mock_conversation)
+    mock_console.clear.assert_called_once()
 
 
 @patch("rich.live.Live")
@@ -81,33 +121,54 @@ def test_handle_streaming_response(mock_live_class, mock_conversation):
     mock_live_class.return_value = mock_live
 
     # Call function to get the content update callback
+    mock_conversation.add_message("user", "Hi again")
     callback = handle_streaming_response(mock_conversation, mock_live)
 
-    # Add an initial assistant message
-    mock_conversation.add_message("assistant", "")
+    # No assistant message is added before content arrives
+    assert len(mock_conversation.messages) == 4
+    mock_live.update.assert_not_called()
 
     # Test the callback with content updates
     callback("Hello")
     callback(" world")
 
-    # Check that the message was updated
+    # Check that a single assistant message was added and updated
+    assert len(mock_conversation.messages) == 5
+    assert mock_conversation.messages[-1].role == "assistant"
     assert mock_conversation.messages[-1].content == "Hello world"
 
-    # Live.update should have been called for each content update
-    assert mock_live.update.call_count >= 2
+    # The display is switched to the response once; Live redraws it on refresh
+    mock_live.update.assert_called_once()
+
+    # The renderable shows the latest content when the display refreshes
+    output = Console(file=io.StringIO(), width=40)
+    output.print(mock_live.update.call_args[0][0])
+    assert "Hello world" in output.file.getvalue()
 
 
 def test_create_loading_display():
     """Test the loading display context manager."""
-    with patch("mini_chat.ui.Progress") as mock_progress_class:
-        mock_progress = MagicMock(spec=Progress)
-        mock_progress_class.return_value = mock_progress
-
-        # Test context manager behavior
-        with create_loading_display("Testing") as progress:
-            assert progress == mock_progress
-            assert mock_progress.add_task.called
-            assert mock_progress.add_task.call_args[0][0] == "Testing"
-
-        # Verify progress.stop was called when context manager exits
-        assert mock_progress.stop.called
+    from mini_chat.ui import _get_loading_progress
+
+    _get_loading_progress.cache_clear()
+    try:
+        with patch("rich.progress.Progress") as mock_progress_class:
+            mock_progress = MagicMock(spec=Progress)
+            mock_progress_class.return_value = mock_progress
+
+            # Test context manager behavior
+            with create_loading_display("Testing") as progress:
+                assert progress == mock_progress
+                assert mock_progress.add_task.called
+                assert mock_progress.add_task.call_args[0][0] == "Testing"
+
+            # Verify the task was removed and progress.stop was called on exit
+            mock_progress.remove_task.assert_called_once_with(mock_progress.add_task.return_value)
+            assert mock_progress.stop.called
+
+            # The Progress is created once and reused for the next message
+            with create_loading_display() as progress:
+                assert progress == mock_progress
+            mock_progress_class.assert_called_once()
+    finally:
+        _get_loading_progress.cache_clear()